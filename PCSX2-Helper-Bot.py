@@ -1,5 +1,6 @@
 import logging
 import logging.config
+import multiprocessing
 import os
 import re
 import time
@@ -7,6 +8,7 @@ import time
 import praw
 
 from modules.cpubot import CPUbot
+from modules.fakereddit import FakeReddit
 from modules.gpubot import GPUbot
 from modules.helperbot import Helperbot
 from modules.wikibot import Wikibot
@@ -27,9 +29,49 @@ github_link = 'https://github.com/Pixxel123/PCSX2-Helper-Bot'
 latest_build = 'https://buildbot.orphis.net/pcsx2/'
 summon_phrase = {'wiki': 'WikiBot', 'cpu': 'CPUBot',
                  'gpu': 'GPUBot', 'help': 'HelperBot'}
+# how often each shard logs its throughput, in seconds
+metrics_interval = 300
+# empty polls before the comment stream yields None so metrics can report while idle,
+# PRAW still backs off between those polls but resets its backoff each time it yields None
+stream_pause_after = 5
+
+
+class ShardMetrics:
+
+    def __init__(self, shard_id, subreddit_names):
+        self.shard_id = shard_id
+        self.subreddit_names = subreddit_names
+        # counts only cover the current interval so slowdowns show up instead of being averaged away
+        self.comments_seen = 0
+        self.replies_posted = 0
+        self.last_report = time.monotonic()
+
+    def record(self, replied):
+        self.comments_seen += 1
+        if replied:
+            self.replies_posted += 1
+        self.tick()
+
+    def tick(self):
+        # also called when the stream comes back empty, so a stalled shard still reports
+        if time.monotonic() - self.last_report >= metrics_interval:
+            self.report()
+
+    def report(self):
+        now = time.monotonic()
+        interval_minutes = max(now - self.last_report, 1) / 60
+        logging.info(
+            f"Shard {self.shard_id} (r/{self.subreddit_names}) last {interval_minutes:.1f} min: {self.comments_seen} comments, {self.replies_posted} replies, {self.comments_seen / interval_minutes:.1f} comments/min")
+        self.comments_seen = 0
+        self.replies_posted = 0
+        self.last_report = now
 
 
 def bot_login():
+    # load tests swap reddit for a fake comment stream, set fake_reddit to the delay between comments in seconds
+    if os.getenv('fake_reddit') is not None:
+        logging.info('Using fake reddit for load testing')
+        return FakeReddit(comment_delay=float(os.getenv('fake_reddit') or 0))
     logging.info('Authenticating...')
     reddit = praw.Reddit(
         client_id=os.getenv('reddit_client_id'),
@@ -57,12 +99,40 @@ def generate_bot_message(comment, bot_reply, phrase, bot_choice):
     return bot_reply
 
 
-def run_bot():
+def get_subreddits():
+    # comma separated list of subreddits to watch, e.g. "pcsx2, emulation"
+    if os.getenv('subreddits'):
+        # subreddit names aren't case-sensitive, so normalise and drop repeats to keep each subreddit in one shard
+        names = [re.sub(r'^/?r/', '', name.strip().lower()).strip() for name in os.getenv('subreddits').split(',')]
+        subreddits = list(dict.fromkeys(name for name in names if name))
+        if subreddits:
+            return subreddits
+        logging.warning(
+            f"No usable subreddit names in subreddits={os.getenv('subreddits')!r}, using the default instead")
+    # uses environment variable to detect whether in Heroku
+    if 'DYNO' in os.environ:
+        return ['pcsx2']
+    return ['cpubottest']
+
+
+def split_shards(subreddits, shard_count):
+    # subreddits are dealt out round robin, each shard multiplexes its share into one stream with PRAW's "a+b" syntax
+    # a comment only belongs to one subreddit, so shards never see the same comment and comment.saved covers repeats
+    shard_count = max(1, min(shard_count, len(subreddits)))
+    return ['+'.join(subreddits[i::shard_count]) for i in range(shard_count)]
+
+
+def run_bot(reddit, subreddit, metrics):
+    comment = None
     try:
         logging.info(
             f"Bot started! Watching comment stream in r/{subreddit}...")
         # look for summon_phrase and reply
-        for comment in subreddit.stream.comments(skip_existing=True):
+        for comment in subreddit.stream.comments(skip_existing=True, pause_after=stream_pause_after):
+            if comment is None:
+                metrics.tick()
+                continue
+            replied = False
             # allows bot command to NOT be case-sensitive and ignores comments made by the bot
             if comment.author.name != reddit.user.me() and not comment.saved:
                 try:
@@ -90,11 +160,13 @@ def run_bot():
                         footer = f"\n\n---\n\n^(Check my commands by commenting `HelperBot! commands`. I'm a bot, and should only be used for reference. If there are any issues, please contact my) ^[Creator](https://www.reddit.com/message/compose/?to=theoriginal123123&subject=/u/PCSX2-Wiki-Bot)\n\n[^GitHub]({github_link})\n"
                         bot_reply += footer
                         comment.reply(bot_reply)
+                        replied = True
                         comment = reddit.comment(id=f"{comment.id}")
                         comment.save()
                         logging.info(f"Comment posted! Saved comment_id: {comment.id}")
                 except Exception:
                     pass
+            metrics.record(replied)
     except Exception as error:
         # dealing with low karma posting restriction
         # bot will use rate limit error to decide how long to sleep for
@@ -116,7 +188,7 @@ def run_bot():
                         #  add one more minute to wait
                         time_remaining = int(i + 60)
                         break
-        else:
+        elif comment is not None:
             # If not rate limited, save comment where info cannot be found
             # so bot is not triggered again
             comment.save()
@@ -129,24 +201,53 @@ def run_bot():
             time.sleep(5)
 
 
+def run_shard(shard_id, subreddit_names):
+    metrics = ShardMetrics(shard_id, subreddit_names)
+    reddit = None
+    while True:
+        try:
+            # logging in inside the retry loop means a failed login is retried rather than ending the shard
+            # each shard logs in separately as PRAW sessions shouldn't be shared between processes
+            if reddit is None:
+                reddit = bot_login()
+            subreddit = reddit.subreddit(subreddit_names)
+            run_bot(reddit, subreddit, metrics)
+        except Exception as error:
+            logging.exception(repr(error))
+            time.sleep(20)
+
+
+def start_shard(context, shard_id, subreddit_names):
+    # daemon workers are stopped along with the parent process
+    worker = context.Process(target=run_shard, args=(shard_id, subreddit_names), name=f"shard-{shard_id}", daemon=True)
+    worker.start()
+    return worker
+
+
 if __name__ == '__main__':
     logging.info('Bot starting...')
+    if 'DYNO' not in os.environ:
+        # if working locally, use .env files
+        import dotenv
+        dotenv.load_dotenv()
+    # lists are scraped once before forking so every shard shares them
     cpubot = CPUbot()
     gpubot = GPUbot()
     wikibot = Wikibot()
     helperbot = Helperbot()
-    reddit = bot_login()
-    while True:
-        try:
-            # uses environment variable to detect whether in Heroku
-            if 'DYNO' in os.environ:
-                subreddit = reddit.subreddit('pcsx2')
-            else:
-                # if working locally, use .env files
-                import dotenv
-                dotenv.load_dotenv()
-                subreddit = reddit.subreddit('cpubottest')
-            run_bot()
-        except Exception as error:
-            logging.exception(repr(error))
-            time.sleep(20)
+    shards = split_shards(get_subreddits(), int(os.getenv('bot_shards', 1)))
+    if len(shards) == 1:
+        run_shard(0, shards[0])
+    else:
+        # fork lets worker processes inherit the bots above instead of pickling them
+        context = multiprocessing.get_context('fork')
+        workers = [start_shard(context, shard_id, subreddit_names)
+                   for shard_id, subreddit_names in enumerate(shards)]
+        # restart any shard that dies so its subreddits don't silently go unwatched
+        while True:
+            time.sleep(30)
+            for shard_id, worker in enumerate(workers):
+                if not worker.is_alive():
+                    logging.error(
+                        f"Shard {shard_id} (r/{shards[shard_id]}) exited with code {worker.exitcode}, restarting...")
+                    workers[shard_id] = start_shard(context, shard_id, shards[shard_id])
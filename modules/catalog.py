@@ -0,0 +1,80 @@
+import sys
+from array import array
+
+
+def pack(strings):
+    # joins strings into one UTF-8 buffer with byte offsets marking where each starts,
+    # avoiding the per object overhead of thousands of small strings.
+    # UTF-8 keeps names like "Ōkami" from widening every other entry, which a packed str would
+    encoded = [string.encode('utf-8') for string in strings]
+    offsets = array('I', [0])
+    for string in encoded:
+        offsets.append(offsets[-1] + len(string) + 1)
+    return b'\0'.join(encoded), offsets
+
+
+def unpack(packed, offsets, position):
+    return packed[offsets[position]:offsets[position + 1] - 1].decode('utf-8')
+
+
+class Catalog:
+    # Name to details page lookup that only keeps the part of each link after the shared base URL,
+    # with links and cleaned names packed into one string each once the list is built
+    __slots__ = ('base_url', 'normalize', '_index', '_slugs', '_slug_offsets', '_normalized_names', '_normalized_offsets')
+
+    def __init__(self, base_url, normalize=None):
+        self.base_url = sys.intern(base_url)
+        # optional function used to precompute the cleaned names the fuzzy matchers compare against
+        self.normalize = normalize
+        # name to position in the packed strings, lookups stay O(1)
+        self._index = {}
+        # built up as lists, freeze() packs them before the catalog is used for lookups
+        self._slugs = []
+        self._normalized_names = []
+        self._slug_offsets = None
+        self._normalized_offsets = None
+
+    def add(self, name, link):
+        # accepts either a full link or one already relative to base_url
+        if link.startswith(self.base_url):
+            link = link[len(self.base_url):]
+        # a duplicate name keeps its first position so _index order stays lined up with the packed strings
+        position = self._index.setdefault(name, len(self._slugs))
+        if position == len(self._slugs):
+            self._slugs.append(link)
+            # without a normalize function the names are the _index keys, so no second copy is kept
+            if self.normalize:
+                self._normalized_names.append(self.normalize(name))
+        else:
+            self._slugs[position] = link
+
+    def freeze(self):
+        self._slugs, self._slug_offsets = pack(self._slugs)
+        if self.normalize:
+            self._normalized_names, self._normalized_offsets = pack(self._normalized_names)
+        else:
+            self._normalized_names = None
+        # only needed while building, and for CPUs it would keep a reference back to the bot
+        self.normalize = None
+        return self
+
+    def normalized_items(self):
+        # name and cleaned name pairs, in the order they were added
+        if self._normalized_names is None:
+            for name in self._index:
+                yield name, name
+            return
+        for position, name in enumerate(self._index):
+            yield name, unpack(self._normalized_names, self._normalized_offsets, position)
+
+    def __getitem__(self, name):
+        return self.base_url + unpack(self._slugs, self._slug_offsets, self._index[name])
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
@@ -8,6 +8,8 @@ import requests
 from bs4 import BeautifulSoup as bs
 from fuzzywuzzy import fuzz, process
 
+from modules.catalog import Catalog
+
 # Logging allows replacing print statements to show more information
 # This config outputs human-readable time, the log level, the log message and the line number this originated from
 logging.basicConfig(
@@ -35,17 +37,17 @@ class CPUbot():
         res = requests.get(self.passmark_page)
         html = bs(res.content, 'lxml')
         cpu_table = html.find('table', id='cputable').find('tbody')
-        cpu_list = {}
+        cpu_list = Catalog('https://www.cpubenchmark.net/', normalize=self.clean_input)
         for row in cpu_table.find_all("tr")[1:]:  # skip header row
             cells = row.find_all("td")
             cpu_name = cells[0].text.split(" @", 1)[0]
             if cpu_name not in ignore_list:
                 cpu_details_link = cells[0].contents[0].attrs['href']
-                cpu_list[cpu_name] = f"https://www.cpubenchmark.net/{cpu_details_link.replace('cpu_lookup', 'cpu')}"
+                cpu_list.add(cpu_name, cpu_details_link.replace('cpu_lookup', 'cpu'))
             else:
                 logging.info(f"Ignored: {cpu_name}")
         logging.info(f"Grabbed {len(cpu_list)} CPU's from list")
-        return cpu_list
+        return cpu_list.freeze()
 
     def clean_input(self, input_string):
         self.input_string = input_string
@@ -110,9 +112,11 @@ class CPUbot():
         logging.info('Looking for CPU...')
         try:
             choices = []
-            for cpu in self.cpu_list:
+            cleaned_lookup = self.clean_input(cpu_lookup)
+            # CPU names are cleaned once when the list is built
+            for cpu, cleaned_cpu in self.cpu_list.normalized_items():
                 match_criteria = fuzz.token_set_ratio(
-                    self.clean_input(cpu), self.clean_input(cpu_lookup))
+                    cleaned_cpu, cleaned_lookup)
                 if match_criteria >= 45:
                     choices.append(cpu)
             closest_match = process.extractOne(
@@ -0,0 +1,73 @@
+import itertools
+import random
+import time
+from types import SimpleNamespace
+
+# Stand-in for praw.Reddit that feeds an endless stream of made up comments,
+# used to load test the comment loop without touching reddit.
+# Sample comments stick to HelperBot commands and chatter so a load test doesn't hammer PassMark or the wiki
+sample_comments = [
+    'Has anyone got this working on the latest dev build?',
+    'HelperBot! specs',
+    'HelperBot! commands',
+    'Which plugin should I be using for this?',
+    'HelperBot! support, steam',
+    'Thanks, that fixed it!',
+]
+
+
+class FakeComment:
+
+    def __init__(self, reddit, comment_id, body='', author='fake_user'):
+        self.reddit = reddit
+        self.id = comment_id
+        self.body = body
+        self.author = SimpleNamespace(name=author)
+
+    @property
+    def saved(self):
+        return self.id in self.reddit.saved_comments
+
+    def reply(self, body):
+        self.reddit.replies_posted += 1
+
+    def save(self):
+        self.reddit.saved_comments.add(self.id)
+
+
+class FakeSubreddit:
+
+    def __init__(self, reddit, display_name):
+        self.reddit = reddit
+        self.display_name = display_name
+        self.stream = SimpleNamespace(comments=self.comments)
+
+    def __str__(self):
+        return self.display_name
+
+    def comments(self, skip_existing=True, pause_after=None):
+        # ids are prefixed with the subreddit so shards never hand out the same id
+        for count in itertools.count():
+            if self.reddit.comment_delay:
+                time.sleep(self.reddit.comment_delay)
+            yield FakeComment(self.reddit, f"{self.display_name}_{count}", random.choice(sample_comments))
+            # like PRAW, yields None when pause_after is set, here after every pause_after + 1 comments,
+            # so the idle path of the comment loop also gets exercised
+            if pause_after is not None and count % (pause_after + 1) == pause_after:
+                yield None
+
+
+class FakeReddit:
+
+    def __init__(self, comment_delay=0):
+        # seconds to wait between comments, 0 streams as fast as the bot can process them
+        self.comment_delay = comment_delay
+        self.saved_comments = set()
+        self.replies_posted = 0
+        self.user = SimpleNamespace(me=lambda: 'fake_bot')
+
+    def subreddit(self, display_name):
+        return FakeSubreddit(self, display_name)
+
+    def comment(self, id):
+        return FakeComment(self, id)
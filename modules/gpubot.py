@@ -8,6 +8,8 @@ import requests
 from bs4 import BeautifulSoup as bs
 from fuzzywuzzy import fuzz, process
 
+from modules.catalog import Catalog
+
 # Logging allows replacing print statements to show more information
 # This config outputs human-readable time, the log level, the log message and the line number this originated from
 logging.basicConfig(
@@ -34,15 +36,15 @@ class GPUbot():
         res = requests.get(self.passmark_gpu_page)
         html = bs(res.content, 'lxml')
         gpu_table = html.find('table', id='cputable').find('tbody')
-        gpu_list = {}
+        gpu_list = Catalog('https://www.videocardbenchmark.net/')
         for row in gpu_table.find_all("tr")[1:]:  # skip header row
             cells = row.find_all("td")
             gpu_name = cells[0].contents[0].text
             gpu_link = cells[0].contents[0].attrs['href'].replace(
                 'video_lookup', 'gpu')
-            gpu_list[gpu_name] = f"https://www.videocardbenchmark.net/{gpu_link}"
+            gpu_list.add(gpu_name, gpu_link)
         logging.info(f"Grabbed {len(gpu_list)} GPU's from list")
-        return gpu_list
+        return gpu_list.freeze()
 
     def get_gpu_info(self, gpu_lookup):
         self.gpu_lookup = gpu_lookup
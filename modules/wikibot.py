@@ -13,6 +13,8 @@ from bs4 import BeautifulSoup as bs
 from fuzzywuzzy import fuzz, process
 from pytablewriter import MarkdownTableWriter
 
+from modules.catalog import Catalog
+
 # Logging allows replacing print statements to show more information
 # This config outputs human-readable time, the log level, the log message and the line number this originated from
 logging.basicConfig(
@@ -39,7 +41,8 @@ class Wikibot:
         res = session.get(self.wiki_complete_url)
         html = bs(res.content, 'lxml')
         game_table = html.find('table', class_='wikitable').find('tbody')
-        games_list = {}
+        # strip out spaces/non-word characters and lower for case-insensitive match
+        games_list = Catalog(self.wiki_base_url, normalize=lambda game: re.sub(r'\W', '', game).lower())
         # Ignores header row
         for row in game_table.find_all('tr')[1:]:
             # There are some hidden rows containing region info only,
@@ -48,11 +51,11 @@ class Wikibot:
                 cell = row.find_all('td')[0]
                 game_name = cell.contents[0].attrs['title']
                 game_link = cell.contents[0].attrs['href']
-                games_list[game_name] = self.wiki_base_url + game_link
+                games_list.add(game_name, game_link)
             except AttributeError:
                 continue
         logging.info(f"Grabbed {len(games_list)} games from wiki")
-        return games_list
+        return games_list.freeze()
 
     def get_game_html(self, game_search):
         self.game_search = game_search
@@ -182,11 +185,10 @@ class Wikibot:
                     # games with roman numerals can skew lookup results, this regex attempts to find them
                     roman_numeral_regex = re.compile(
                         r'(?=[MDCLXVI])M*(C[MD]|D?C{0,3})(X[CL]|L?X{0,3})(I[XV]|V?I{0,3})$', flags=re.IGNORECASE)
-                    for game in self.games_list:
-                        # strip out spaces/non-word characters and lower for case-insensitive match
-                        cleaned_lookup = re.sub(r'\W', '', game_lookup).lower()
-                        cleaned_game_list_entry = re.sub(
-                            r'\W', '', game).lower()
+                    # strip out spaces/non-word characters and lower for case-insensitive match
+                    cleaned_lookup = re.sub(r'\W', '', game_lookup).lower()
+                    # wiki entries are cleaned once when the games list is built
+                    for game, cleaned_game_list_entry in self.games_list.normalized_items():
                         try:
                             # if cleaned_game_list_entry has numeral AND game_lookup ends with number
                             # try roman_numeral_parse